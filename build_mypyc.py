@@ -0,0 +1,55 @@
+# build_mypyc.py
+# =========================
+# Optional ahead-of-time compilation of the game logic with mypyc.
+#
+# This is a build script, not a package setup: the game is still run with
+# 'python src/cli.py' and nothing here is used by pip.
+#
+# Build requirements (see requirements-build.txt):
+#   pip install -r requirements-build.txt
+#
+# Usage, from anywhere:
+#   python build_mypyc.py
+#
+# This places a compiled 'game' extension module next to src/game.py; cli.py,
+# storage.py and the tests import it transparently. Delete the generated
+# src/game.*.so (or .pyd on Windows) to go back to the pure-Python module.
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def main() -> None:
+    try:
+        from mypyc.build import mypycify
+        from setuptools import setup
+    except ImportError:
+        sys.exit("build_mypyc.py needs mypy and setuptools: pip install -r requirements-build.txt")
+
+    os.chdir(ROOT)
+
+    # src/ is the import root (see pytest.ini), so compile src/game.py as module
+    # 'game' rather than 'src.game'. MYPYPATH is only set while mypyc runs.
+    old_mypypath = os.environ.get("MYPYPATH")
+    os.environ["MYPYPATH"] = "src"
+    try:
+        ext_modules = mypycify(["--explicit-package-bases", "src/game.py"])
+    finally:
+        if old_mypypath is None:
+            del os.environ["MYPYPATH"]
+        else:
+            os.environ["MYPYPATH"] = old_mypypath
+
+    setup(
+        name="guessing_game",
+        package_dir={"": "src"},
+        py_modules=[],
+        ext_modules=ext_modules,
+        script_args=["build_ext", "--inplace"],
+    )
+
+
+if __name__ == '__main__':
+    main()
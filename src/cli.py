@@ -13,14 +13,32 @@ from typing import Optional, List, Tuple
 from game import PlayerSession
 import storage
 
-EXIT_COMMANDS = {'q', 'quit', 'exit'}
+EXIT_COMMANDS = frozenset({'q', 'quit', 'exit'})
+_MAX_EXIT_COMMAND_LEN = max(len(cmd) for cmd in EXIT_COMMANDS)
+
+
+def _ask(prompt: str) -> str:
+    """
+    Read one line of input after showing prompt.
+    Uses input() for an interactive terminal; when stdin is a pipe or file
+    (scripted runs), writes the prompt and reads the line directly instead.
+    Raises EOFError when input is exhausted, like input().
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
 
 
 def prompt_player_name() -> str:
-    name = input("Enter your name: ").strip()
+    name = _ask("Enter your name: ").strip()
     while not name:
         print("Name cannot be empty. Please enter your name.")
-        name = input("Enter your name: ").strip()
+        name = _ask("Enter your name: ").strip()
     return name
 
 
@@ -29,8 +47,9 @@ def prompt_guess() -> Optional[str]:
     Prompt the user for a 4-digit guess or an exit command.
     Returns the guess string or None if the user wants to quit.
     """
-    guess = input("Enter your 4-digit guess (or 'q' to quit): ").strip()
-    if guess.lower() in EXIT_COMMANDS:
+    guess = _ask("Enter your 4-digit guess (or 'q' to quit): ").strip()
+    # Only short inputs can be exit commands, so skip lowercasing anything longer
+    if len(guess) <= _MAX_EXIT_COMMAND_LEN and guess.lower() in EXIT_COMMANDS:
         return None
     return guess
 
@@ -39,16 +58,23 @@ def validate_guess(guess: str) -> bool:
     """
     Checks that the guess is exactly 4 unique digits.
     Returns True if valid, False otherwise.
+    Digits and duplicates are checked in a single pass, tracking the
+    digits seen so far as bits of an integer (bit d set = digit d seen).
     """
     if len(guess) != 4:
         print("Invalid input: Guess must be exactly 4 digits.")
         return False
-    if not guess.isdigit():
-        print("Invalid input: Guess must only contain digits (0-9).")
-        return False
-    if len(set(guess)) != 4:
-        print("Invalid input: Guess must have no duplicate digits.")
-        return False
+    seen = 0
+    for ch in guess:
+        d = ord(ch) - 48  # 48 == ord('0')
+        if d < 0 or d > 9:
+            print("Invalid input: Guess must only contain digits (0-9).")
+            return False
+        bit = 1 << d
+        if seen & bit:
+            print("Invalid input: Guess must have no duplicate digits.")
+            return False
+        seen |= bit
     return True
 
 
@@ -62,14 +88,16 @@ def display_feedback(feedback: str) -> None:
 def display_leaderboard(top_sessions: List[Tuple[str, int, float, float, str]]) -> None:
     """
     Display the global top scores.
+    The whole table is built first and written to stdout in a single call.
     """
-    print("\n=== Global Leaderboard ===")
     header = f"{'Rank':<4}  {'Name':<10} {'Guesses':<7} {'Time(s)':<8} {'Score':<6} Played At"
-    print(header)
-    for idx, (name, guesses, tsec, score, played_at) in enumerate(top_sessions, start=1):
-        line = f"{idx:<4}  {name:<10} {guesses:^7}  {tsec:^8.1f}  {score:^6.1f}  {played_at}"
-        print(line)
-    print("==========================\n")
+    lines = ["\n=== Global Leaderboard ===", header]
+    lines.extend(
+        f"{idx:<4}  {name:<10} {guesses:^7}  {tsec:^8.1f}  {score:^6.1f}  {played_at}"
+        for idx, (name, guesses, tsec, score, played_at) in enumerate(top_sessions, start=1)
+    )
+    lines.append("==========================\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -109,7 +137,7 @@ def main():
         display_leaderboard(top_sessions)
 
         # Prompt for replay
-        again = input("Play again? (y/n): ").strip().lower()
+        again = _ask("Play again? (y/n): ").strip().lower()
         if again != 'y':
             print("Thanks for playing! Goodbye.")
             break
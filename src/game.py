@@ -12,6 +12,7 @@
 #       * Manages a single game session for a player.
 #       * Tracks player name, secret number, start time, and guess count.
 #       * Provides make_guess() to process guesses and detect victory.
+#       * submit_guess() detects victory only, leaving feedback to be built on demand.
 #       * Exposes elapsed_time and calculate_score() for performance metrics.
 
 
@@ -23,29 +24,35 @@ from typing import Optional
 GUESS_WEIGHT = 5      # cost per guess
 TIME_DIVISOR = 10     # divisor to scale time into score impact
 
+# Digit characters '0'-'9' as bytes, built once at import time
+_DIGITS = b"0123456789"
+
+# Byte values of the feedback characters
+_PLUS = ord('+')
+_MINUS = ord('-')
+_SPACE = ord(' ')
+
 
 def pick_secret() -> str:
     """
     Generate a 4-digit secret number with no duplicate digits.
     Digits may include '0'.
     Steps:
-      1. Create a list of digit characters '0' through '9'.
-      2. Randomly select 4 unique digits from this list.
-      3. Join the selected digits into a single string.
+      1. Copy the precomputed _DIGITS into a mutable pool.
+      2. Run the first 4 steps of a Fisher-Yates shuffle, so pool[:4]
+         holds 4 unique, uniformly chosen digits.
+      3. Decode those 4 bytes into a string.
     Returns:
         A 4-character string, e.g. '5271'.
     """
-    all_digits = []
-    for d in range(10):  # 0-9
-        all_digits.append(str(d))
-
-    # use random.sample to pick 4 unique digits
-    # random.sample returns a new list of length 4
-    selected_digits = random.sample(all_digits, 4)
-
-    # convert the list of characters into a string
-    secret_number = ''.join(selected_digits)
-    return secret_number
+    pool = bytearray(_DIGITS)
+    randrange = random.randrange
+    n = len(pool)
+    for i in range(4):
+        # swap a random not-yet-chosen digit into position i
+        j = i + randrange(n - i)
+        pool[i], pool[j] = pool[j], pool[i]
+    return pool[:4].decode()
 
 
 def evaluate_guess(secret: str, guess: str) -> str:
@@ -58,41 +65,157 @@ def evaluate_guess(secret: str, guess: str) -> str:
 
     Returns a 4-character string showing feedback in positional order.
     """
-    feedback = []
-    for i, digit in enumerate(guess):
-        if digit == secret[i]:
-            feedback.append('+')
-        elif digit in secret:
-            feedback.append('-')
+    secret_bytes = secret.encode()
+    guess_bytes = guess.encode()
+    return _evaluate_packed(_pack(secret_bytes), frozenset(secret_bytes), guess_bytes, _pack(guess_bytes))
+
+
+def _pack(digits: bytes) -> int:
+    """
+    Pack up to 4 bytes into one int, byte i of the input in byte i of the result.
+    """
+    return int.from_bytes(digits, 'little')
+
+
+def _equal_bytes_mask(secret_u32: int, guess_u32: int) -> int:
+    """
+    Compare two packed values byte by byte in one go (SWAR).
+    Returns an int with the high bit (0x80) of byte i set exactly where
+    byte i of both values is equal, i.e. where their XOR has a zero byte.
+    Adding 0x7F to the low 7 bits of each byte carries into the high bit
+    unless those bits are all zero, so no borrow leaks between bytes.
+    """
+    x = secret_u32 ^ guess_u32
+    return ~(((x & 0x7F7F7F7F) + 0x7F7F7F7F) | x | 0x7F7F7F7F) & 0x80808080
+
+
+def _evaluate_packed(secret_u32: int, secret_set: frozenset, guess_bytes: bytes, guess_u32: int) -> str:
+    """
+    Core of evaluate_guess() working on pre-computed data.
+    secret_u32 is the packed secret, used to find all '+' positions with a
+    single XOR; secret_set is the set of the secret's byte values, so each
+    '-' check is a single hash lookup. PlayerSession caches both once per secret.
+    guess_bytes is the encoded guess and guess_u32 the same bytes packed,
+    so callers that already packed the guess don't pay for it twice.
+    """
+    equal = _equal_bytes_mask(secret_u32, guess_u32)
+    feedback = bytearray(len(guess_bytes))
+    for i, c in enumerate(guess_bytes):
+        if equal >> (8 * i + 7) & 1:
+            feedback[i] = _PLUS
+        elif c in secret_set:
+            feedback[i] = _MINUS
         else:
-            feedback.append(' ')
+            feedback[i] = _SPACE
 
-    return ''.join(feedback)
+    return feedback.decode()
 
 
 class PlayerSession:
     """
     Tracks a single playthrough: player name, secret, start time, and guesses.
     """
+    # Fixed attribute layout: no per-instance __dict__, smaller sessions
+    # and faster attribute access. Every attribute set on self must be listed.
+    __slots__ = (
+        'player_name', '_secret', '_secret_u32', '_secret_set', 'start_time',
+        'guess_count', 'solved', '_last_guess', '_last_feedback', '_final_elapsed', '_final_score',
+    )
+
+    # Attribute types, also used by mypyc to lay out native fields when compiled
+    player_name: str
+    _secret: str
+    _secret_u32: int
+    _secret_set: frozenset
+    start_time: float
+    guess_count: int
+    solved: bool
+    _last_guess: Optional[str]
+    _last_feedback: Optional[str]
+    _final_elapsed: Optional[float]
+    _final_score: Optional[float]
+
     def __init__(self, player_name: str):
         self.player_name = player_name
         self.secret = pick_secret()
         self.start_time = time.time()
         self.guess_count = 0
         self.solved = False
-        self.last_feedback: Optional[str] = None
+        self._last_guess = None
+        # Frozen when the session is solved by submit_guess() / make_guess()
+        self._final_elapsed = None
+        self._final_score = None
+
+    @property
+    def secret(self) -> str:
+        """
+        The secret number. Setting it also refreshes the encoded copies
+        used by make_guess().
+        """
+        return self._secret
+
+    @secret.setter
+    def secret(self, value: str) -> None:
+        self._secret = value
+        secret_bytes = value.encode()
+        self._secret_u32 = _pack(secret_bytes)
+        self._secret_set = frozenset(secret_bytes)
+        self._last_feedback = None
+
+    def submit_guess(self, guess: str) -> bool:
+        """
+        Process a guess string without building its feedback: increment count
+        and check for a win by comparing the packed guess to the packed secret.
+        If guess matches secret, mark session as solved and freeze the
+        elapsed time and score so later reads return the same values.
+        The feedback string is built on demand by last_feedback.
+        Returns True if the session is solved.
+        """
+        self._last_guess = guess
+        self._last_feedback = None
+        guess_bytes = guess.encode()
+        self._record_guess(guess_bytes, _pack(guess_bytes))
+        return self.solved
 
     def make_guess(self, guess: str) -> str:
         """
-        Process a guess string: increment count, evaluate feedback.
-        If guess matches secret, mark session as solved.
+        Process a guess string like submit_guess() and evaluate its feedback.
+        The guess is encoded and packed once, for both the win check and the feedback.
         Returns feedback string.
         """
+        self._last_guess = guess
+        guess_bytes = guess.encode()
+        guess_u32 = _pack(guess_bytes)
+        self._record_guess(guess_bytes, guess_u32)
+        feedback = _evaluate_packed(self._secret_u32, self._secret_set, guess_bytes, guess_u32)
+        self._last_feedback = feedback
+        return feedback
+
+    def _record_guess(self, guess_bytes: bytes, guess_u32: int) -> None:
+        """
+        Count a guess and check for a win on its packed form.
+        The length check stops trailing NUL bytes (which pack to the same
+        int) from matching. On the first win, freeze elapsed time and score.
+        """
         self.guess_count += 1
-        self.last_feedback = evaluate_guess(self.secret, guess)
-        if self.last_feedback == '++++':  # if all positions correct
+        if not self.solved and guess_u32 == self._secret_u32 and len(guess_bytes) == 4:
             self.solved = True
-        return self.last_feedback
+            self._final_elapsed = time.time() - self.start_time
+            # _final_score is still None here, so this computes from the frozen elapsed time
+            self._final_score = self.calculate_score()
+
+    @property
+    def last_feedback(self) -> Optional[str]:
+        """
+        Feedback for the most recent guess, or None before the first guess.
+        Built on first access and cached until the next guess.
+        """
+        if self._last_feedback is None and self._last_guess is not None:
+            guess_bytes = self._last_guess.encode()
+            self._last_feedback = _evaluate_packed(
+                self._secret_u32, self._secret_set, guess_bytes, _pack(guess_bytes)
+            )
+        return self._last_feedback
 
     # @property decorator provides a way to define methods that can be accessed like attributes,
     # allowing for access to an object's data
@@ -100,7 +223,10 @@ class PlayerSession:
     def elapsed_time(self) -> float:
         """
         Returns elapsed time in seconds since session start.
+        Once solved by make_guess(), returns the time frozen at the winning guess.
         """
+        if self._final_elapsed is not None:
+            return self._final_elapsed
         return time.time() - self.start_time
 
     def calculate_score(self) -> float:
@@ -117,9 +243,13 @@ class PlayerSession:
           - Every TIME_DIVISOR seconds adds 1 point:
               10 s → 1 point, 30 s → 3 points, 125 s → 12.5 points.
 
+        Once solved by make_guess(), the score frozen at the winning guess is returned.
+
         Returns:
             A float representing the total score.
         """
+        if self._final_score is not None:
+            return self._final_score
         raw_score = (self.guess_count * GUESS_WEIGHT) + (self.elapsed_time / TIME_DIVISOR)
         return raw_score
 
@@ -0,0 +1,124 @@
+# game_fast.py
+# =========================
+# Fast Path: Packed-Integer Guess Evaluation
+#
+# Optional helpers for solvers and simulations that evaluate millions of guesses:
+#   - pack(): Encode a 4-character string as a single int (one byte per char, little-endian).
+#   - unpack(): Decode such an int back into a 4-character string.
+#   - evaluate_packed(): Same rules as game.evaluate_guess(), on packed ints,
+#       returning the packed feedback ('+', '-', ' ' as bytes).
+#   - evaluate_guess_fast(): String-in/string-out wrapper around evaluate_packed().
+#   - encode_guesses(): Encode many guesses as an (N, 4) uint8 NumPy array.
+#   - evaluate_guesses_batch(): Evaluate all encoded guesses against one secret at once.
+#
+# evaluate_packed() is compiled with Numba when it is installed (pip install numba).
+# Without Numba the same code runs as plain Python, so results are identical either way.
+# The batch functions need NumPy (pip install numpy).
+
+from typing import Iterable
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit when Numba is not installed: returns the function unchanged.
+        """
+        def decorator(func):
+            return func
+        return decorator
+
+
+def pack(digits: str) -> int:
+    """
+    Pack a 4-character string into an int, character i in byte i.
+    """
+    return int.from_bytes(digits.encode(), 'little')
+
+
+def unpack(packed: int) -> str:
+    """
+    Unpack an int produced by pack() or evaluate_packed() into a 4-character string.
+    """
+    return packed.to_bytes(4, 'little').decode()
+
+
+@njit(cache=True)
+def evaluate_packed(secret_u32, guess_u32):
+    """
+    Evaluate a packed guess against a packed secret.
+    For each byte position i:
+      '+' (43) if the guess byte equals the secret byte
+      '-' (45) if the guess byte appears elsewhere in the secret
+      ' ' (32) otherwise
+    Returns the 4 feedback bytes packed the same way as the inputs.
+    """
+    out = 0
+    for i in range(4):
+        s = (secret_u32 >> (8 * i)) & 0xFF
+        g = (guess_u32 >> (8 * i)) & 0xFF
+        if g == s:
+            out |= 43 << (8 * i)
+        else:
+            present = False
+            for j in range(4):
+                if ((secret_u32 >> (8 * j)) & 0xFF) == g:
+                    present = True
+                    break
+            out |= (45 if present else 32) << (8 * i)
+    return out
+
+
+def evaluate_guess_fast(secret: str, guess: str) -> str:
+    """
+    Drop-in equivalent of game.evaluate_guess() for 4-character inputs,
+    backed by evaluate_packed().
+    """
+    return unpack(evaluate_packed(pack(secret), pack(guess)))
+
+
+def _require_numpy() -> None:
+    if not NUMPY_AVAILABLE:
+        raise ImportError("Batch evaluation requires NumPy: pip install numpy")
+
+
+def encode_guesses(guesses: Iterable[str]) -> "np.ndarray":
+    """
+    Encode 4-character guess strings as an (N, 4) uint8 array of their bytes.
+    Encode the candidate set once and reuse it across evaluate_guesses_batch() calls.
+    Raises ValueError if any guess does not encode to exactly 4 bytes.
+    """
+    _require_numpy()
+    encoded = [guess.encode() for guess in guesses]
+    for guess_bytes in encoded:
+        if len(guess_bytes) != 4:
+            raise ValueError(f"Guess must encode to exactly 4 bytes, got {guess_bytes!r}")
+    data = b''.join(encoded)
+    if len(data) != 4 * len(encoded):
+        raise ValueError("Encoded guesses do not add up to 4 bytes each")
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(encoded), 4)
+
+
+def evaluate_guesses_batch(secret: str, guesses_u8: "np.ndarray") -> "np.ndarray":
+    """
+    Evaluate every row of guesses_u8 (as built by encode_guesses()) against secret.
+    Returns an (N, 4) uint8 array of feedback bytes ('+', '-' or ' ').
+    Convert a row for display with bytes(row).decode().
+    """
+    _require_numpy()
+    s = np.frombuffer(secret.encode(), dtype=np.uint8)                   # (4,)
+    plus = guesses_u8 == s                                               # (N, 4)
+    minus = (guesses_u8[:, :, None] == s[None, None, :]).any(axis=2) & ~plus
+    out = np.full(guesses_u8.shape, ord(' '), dtype=np.uint8)
+    out[minus] = ord('-')
+    out[plus] = ord('+')
+    return out
@@ -5,16 +5,37 @@
 # This module handles all interactions with the SQLite database:
 #   - init_db(): Create the 'scores' table and index if they don't exist.
 #   - save_session(): Persist a completed PlayerSession to the database.
+#   - save_sessions(): Persist many completed sessions in one transaction.
 #   - get_top_n(): Retrieve the top N sessions ordered by best (lowest) score.
+#   - get_top_n_np(): Same ranking as get_top_n(), computed in NumPy over all rows.
+#   - close_all(): Close the shared connections (also run automatically at exit).
 
+import atexit
 import sqlite3
 import time
-from typing import List, Tuple
-from game import PlayerSession
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+# PlayerSession is only needed for type hints; importing it lazily keeps
+# 'import storage' from pulling in the game module at startup.
+if TYPE_CHECKING:
+    from game import PlayerSession
 
 # Database filename
 DB_FILENAME = "scores.db"
 
+# In-memory cache for leaderboard reads, keyed by (db_path, n).
+# Each entry holds (cached_at, rows), with cached_at from time.monotonic() so
+# wall-clock changes can't keep an entry alive, and rows as an immutable tuple.
+# Entries expire after _CACHE_TTL seconds and the whole cache is cleared
+# whenever a new session is saved.
+_TOP_N_CACHE: Dict[Tuple[str, int], Tuple[float, tuple]] = {}
+_CACHE_TTL = 30.0
+
+# Open connections, one per database path. Connections are created lazily by
+# _get_conn() and reused across calls instead of reconnecting every time.
+_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+
 # SQL statement to create the main scores table if it doesn't exist.
 # Columns:
 #   id           INTEGER PRIMARY KEY AUTOINCREMENT  -- unique row identifier
@@ -34,11 +55,19 @@ CREATE TABLE IF NOT EXISTS scores (
 );
 """
 
-# SQL statement to create an index on (score, played_at) for fast leaderboard queries.
+# SQL statement to create a covering index for fast leaderboard queries.
 # ORDER BY score ASC (best/lowest first), played_at DESC (newest first for tie-breakers).
+# The remaining selected columns are appended so SELECT_TOP_N_SQL is answered
+# from the index alone, without looking up rows in the table.
 CREATE_INDEX_SQL = """
-CREATE INDEX IF NOT EXISTS idx_scores_score_played_at
-    ON scores(score ASC, played_at DESC);
+CREATE INDEX IF NOT EXISTS idx_scores_leaderboard
+    ON scores(score ASC, played_at DESC, player_name, guesses, time_seconds);
+"""
+
+# The older (score, played_at) index is fully covered by idx_scores_leaderboard;
+# drop it from existing databases so inserts don't maintain two indexes.
+DROP_OLD_INDEX_SQL = """
+DROP INDEX IF EXISTS idx_scores_score_played_at;
 """
 
 # SQL template for inserting a new session record.
@@ -57,45 +86,107 @@ ORDER BY score ASC, played_at DESC
 LIMIT ?;
 """
 
+# SQL template for selecting every record, for in-memory ranking with NumPy.
+SELECT_ALL_SQL = """
+SELECT player_name, guesses, time_seconds, score, played_at
+FROM scores;
+"""
+
+# NumPy structured dtype for rows returned by get_top_n_np().
+# time_seconds is stored as float32 (display only); score stays float64 so the
+# ranking matches get_top_n(). Names longer than 64 characters are truncated.
+_SCORES_DTYPE_FIELDS = [
+    ('player_name', 'U64'),
+    ('guesses', 'i4'),
+    ('time_seconds', 'f4'),
+    ('score', 'f8'),
+    ('played_at', 'U19'),
+]
+
+
+def _get_conn(db_path: str = DB_FILENAME) -> sqlite3.Connection:
+    """
+    Return the shared connection for db_path, opening it on first use.
+    The connection runs in autocommit mode with WAL journaling, so writes
+    don't block readers and each commit avoids a full rollback-journal fsync.
+    """
+    conn = _CONNECTIONS.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-8000")  # negative value = size in KiB (~8 MB)
+        _CONNECTIONS[db_path] = conn
+    return conn
+
+
+def close_all() -> None:
+    """
+    Close every open connection. Registered with atexit.
+    """
+    while _CONNECTIONS:
+        _, conn = _CONNECTIONS.popitem()
+        conn.close()
+
+
+atexit.register(close_all)
+
 
 def init_db(db_path: str = DB_FILENAME) -> None:
     """
     Initialize the SQLite database: create table and index if needed.
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(CREATE_TABLE_SQL)
-    cursor.execute(CREATE_INDEX_SQL)
-    conn.commit()
-    conn.close()
+    conn = _get_conn(db_path)
+    conn.execute(CREATE_TABLE_SQL)
+    conn.execute(CREATE_INDEX_SQL)
+    conn.execute(DROP_OLD_INDEX_SQL)
 
 
-def save_session(session: PlayerSession, db_path: str = DB_FILENAME) -> None:
+def _session_row(session: "PlayerSession") -> Tuple[str, int, float, float, str]:
     """
-    Save a completed PlayerSession to the database.
-    Parameters:
-        session: a PlayerSession instance that has been solved.
+    Build the INSERT_SESSION_SQL parameters for a solved PlayerSession.
     """
     if not session.solved:
         raise ValueError("Cannot save session: game not solved yet.")
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
     # Compute the played_at timestamp as ISO-8601
-    played_at = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(session.start_time + session.elapsed_time))
-
-    cursor.execute(
-        INSERT_SESSION_SQL,
-        (
-            session.player_name,
-            session.guess_count,
-            session.elapsed_time,
-            session.calculate_score(),
-            played_at
-        )
+    played_at = datetime.fromtimestamp(session.start_time + session.elapsed_time).isoformat(timespec='seconds')
+    return (
+        session.player_name,
+        session.guess_count,
+        session.elapsed_time,
+        session.calculate_score(),
+        played_at
     )
-    conn.commit()
-    conn.close()
+
+
+def save_session(session: "PlayerSession", db_path: str = DB_FILENAME) -> None:
+    """
+    Save a completed PlayerSession to the database.
+    Parameters:
+        session: a PlayerSession instance that has been solved.
+    """
+    save_sessions([session], db_path=db_path)
+
+
+def save_sessions(sessions: Iterable["PlayerSession"], db_path: str = DB_FILENAME) -> None:
+    """
+    Save several completed PlayerSessions in a single transaction.
+    All sessions must be solved; if any is not, nothing is written.
+    Parameters:
+        sessions: an iterable of solved PlayerSession instances.
+    """
+    rows = [_session_row(session) for session in sessions]
+
+    conn = _get_conn(db_path)
+    # The connection is in autocommit mode, so open the transaction explicitly;
+    # 'with conn' commits on success and rolls back on error.
+    with conn:
+        conn.execute("BEGIN")
+        conn.executemany(INSERT_SESSION_SQL, rows)
+    # New data invalidates any cached leaderboard
+    _TOP_N_CACHE.clear()
 
 
 def get_top_n(n: int = 10, db_path: str = DB_FILENAME) -> List[Tuple[str, int, float, float, str]]:
@@ -103,10 +194,38 @@ def get_top_n(n: int = 10, db_path: str = DB_FILENAME) -> List[Tuple[str, int, f
     Retrieve the top N sessions from the database.
     Returns a list of tuples:
         (player_name, guesses, time_seconds, score, played_at)
+    Results are served from an in-memory cache for up to _CACHE_TTL seconds;
+    each call gets its own list, so callers may modify it freely.
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute(SELECT_TOP_N_SQL, (n,))
-    rows = cursor.fetchall()
-    conn.close()
+    key = (db_path, n)
+    entry = _TOP_N_CACHE.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _CACHE_TTL:
+        return list(entry[1])
+
+    rows = _get_conn(db_path).execute(SELECT_TOP_N_SQL, (n,)).fetchall()
+    _TOP_N_CACHE[key] = (time.monotonic(), tuple(rows))
     return rows
+
+
+def get_top_n_np(n: int = 10, db_path: str = DB_FILENAME):
+    """
+    Retrieve the top N sessions as a NumPy structured array with fields
+        player_name, guesses, time_seconds, score, played_at
+    ranked like get_top_n() (score ascending, newest first on ties).
+    All rows are loaded and the top N are selected with np.partition, which
+    suits analytics over many rows. Requires NumPy (pip install numpy).
+    """
+    import numpy as np  # optional dependency, only needed here
+
+    cursor = _get_conn(db_path).execute(SELECT_ALL_SQL)
+    arr = np.fromiter(cursor, dtype=np.dtype(_SCORES_DTYPE_FIELDS))
+    if n <= 0:
+        return arr[:0]
+    if n < len(arr):
+        # Keep every row scoring at or below the n-th best, including ties at the cutoff
+        cutoff = np.partition(arr['score'], n - 1)[n - 1]
+        arr = arr[arr['score'] <= cutoff]
+    # Newest first, then a stable sort by score keeps that order among equal scores
+    arr = arr[np.argsort(arr['played_at'], kind='stable')[::-1]]
+    arr = arr[np.argsort(arr['score'], kind='stable')]
+    return arr[:n]
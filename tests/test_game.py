@@ -23,7 +23,8 @@ def test_pick_secret_length_and_uniqueness():
         ('0001', '1000', '-++-'),
         ('9876', '6789', '----'),
         ('0123', '0123', '++++'),
-        ('0123', '4567', '    ')
+        ('0123', '4567', '    '),
+        ('0245', '0345', '+ ++'),  # '3' ^ '2' == 0x01 next to an equal byte
     ]
 )
 def test_evaluate_guess_various(secret, guess, expected_feedback):
@@ -102,3 +103,34 @@ def test_player_session_flow_and_score(monkeypatch):
     expected_score = (3 * 5) + ((elapsed) / 10)
     assert pytest.approx(session.calculate_score(), rel=1e-3) == expected_score
 
+
+def test_elapsed_time_and_score_frozen_on_solve(monkeypatch):
+    session = PlayerSession('Tester')
+    session.secret = '1234'
+    session.start_time = 1000.0
+
+    monkeypatch.setattr(time_module, 'time', lambda: 1030.0)
+    session.make_guess('1234')
+    assert session.solved
+
+    # Time keeps moving, but the solved session's metrics should not
+    monkeypatch.setattr(time_module, 'time', lambda: 2000.0)
+    assert session.elapsed_time == 30.0
+    assert session.calculate_score() == (1 * 5) + (30.0 / 10)
+
+
+def test_submit_guess_detects_win_and_builds_feedback_lazily():
+    session = PlayerSession('Tester')
+    session.secret = '5678'
+    assert session.last_feedback is None
+
+    assert session.submit_guess('5167') is False
+    assert session.guess_count == 1
+    assert session.last_feedback == '+ --'
+
+    # Trailing NUL bytes pack to the same int as the secret, but are not a win
+    assert session.submit_guess('5678\x00') is False
+
+    assert session.submit_guess('5678') is True
+    assert session.solved
+    assert session.last_feedback == '++++'
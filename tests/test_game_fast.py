@@ -0,0 +1,49 @@
+# tests/test_game_fast.py
+# =========================
+# Tests for the packed-integer evaluation helpers.
+# The packed tests run with or without Numba installed; the batch test needs NumPy.
+# All results must match game.evaluate_guess().
+
+import itertools
+import pytest
+
+from game import evaluate_guess
+from game_fast import (
+    pack, unpack, evaluate_packed, evaluate_guess_fast,
+    encode_guesses, evaluate_guesses_batch,
+)
+
+
+def test_pack_unpack_round_trip():
+    assert unpack(pack('0561')) == '0561'
+
+
+@pytest.mark.parametrize("secret", ['1234', '0561', '9876', '0001'])
+def test_evaluate_packed_matches_evaluate_guess(secret):
+    # Compare against every 4-digit guess without duplicate digits
+    for digits in itertools.permutations('0123456789', 4):
+        guess = ''.join(digits)
+        assert evaluate_guess_fast(secret, guess) == evaluate_guess(secret, guess), (
+            f"Mismatch for secret={secret} guess={guess}"
+        )
+    assert unpack(evaluate_packed(pack(secret), pack(secret))) == '++++'
+
+
+def test_evaluate_guesses_batch_matches_evaluate_guess():
+    pytest.importorskip("numpy")
+    guesses = [''.join(digits) for digits in itertools.permutations('0123456789', 4)]
+    encoded = encode_guesses(guesses)
+    assert encoded.shape == (5040, 4)
+
+    feedback = evaluate_guesses_batch('0561', encoded)
+    for guess, row in zip(guesses, feedback):
+        assert bytes(row).decode() == evaluate_guess('0561', guess), f"Mismatch for guess={guess}"
+
+
+def test_encode_guesses_rejects_wrong_length():
+    pytest.importorskip("numpy")
+    # Joined these are 8 bytes, which must not be regrouped into '1234' and '5678'
+    with pytest.raises(ValueError):
+        encode_guesses(['123', '4567', '8'])
+    with pytest.raises(ValueError):
+        encode_guesses(['12é4'])
@@ -127,3 +127,105 @@ def test_save_session_unsolved_raises(tmp_path):
     assert 'not solved' in msg.lower(), (
         "Error message should mention that the session is not solved"
     )
+
+
+def test_get_top_n_cache_invalidated_on_save(tmp_path):
+    """
+    get_top_n() caches its result; save_session() must clear that cache
+    so a newly saved session shows up on the next leaderboard read.
+    """
+    db_file = tmp_path / "leaderboard.db"
+    storage.init_db(db_path=str(db_file))
+    assert storage.get_top_n(db_path=str(db_file)) == []
+
+    session = PlayerSession('Dana')
+    session.guess_count = 1
+    session.solved = True
+    storage.save_session(session, db_path=str(db_file))
+
+    top = storage.get_top_n(db_path=str(db_file))
+    assert len(top) == 1, "Cached empty leaderboard should be invalidated by save_session()"
+    assert top[0][0] == 'Dana'
+
+    # Mutating a returned list must not affect what later callers get from the cache
+    top.clear()
+    assert len(storage.get_top_n(db_path=str(db_file))) == 1
+
+
+def test_connection_is_reused_in_wal_mode(tmp_path):
+    """
+    init_db() and later calls should share one connection, opened in WAL mode.
+    """
+    db_file = tmp_path / "leaderboard.db"
+    storage.init_db(db_path=str(db_file))
+    conn = storage._get_conn(str(db_file))
+    assert storage._get_conn(str(db_file)) is conn, "Connection should be reused per db path"
+    mode = conn.execute("PRAGMA journal_mode;").fetchone()[0]
+    assert mode.lower() == 'wal'
+
+
+def test_save_sessions_batch(tmp_path):
+    """
+    save_sessions() inserts all sessions in one transaction, and writes
+    nothing if any session in the batch is unsolved.
+    """
+    db_file = tmp_path / "leaderboard.db"
+    storage.init_db(db_path=str(db_file))
+
+    sessions = []
+    for name, guesses in [('Eve', 2), ('Finn', 1), ('Gil', 3)]:
+        session = PlayerSession(name)
+        session.guess_count = guesses
+        session.solved = True
+        sessions.append(session)
+
+    unsolved = PlayerSession('Hank')
+    with pytest.raises(ValueError):
+        storage.save_sessions(sessions + [unsolved], db_path=str(db_file))
+    assert storage.get_top_n(db_path=str(db_file)) == [], "Failed batch must not write any rows"
+
+    storage.save_sessions(sessions, db_path=str(db_file))
+    names = [row[0] for row in storage.get_top_n(db_path=str(db_file))]
+    assert names == ['Finn', 'Eve', 'Gil']
+
+
+def test_top_n_query_uses_covering_index(tmp_path):
+    """
+    The leaderboard query should be served by an index-only scan.
+    """
+    db_file = tmp_path / "leaderboard.db"
+    storage.init_db(db_path=str(db_file))
+    conn = sqlite3.connect(str(db_file))
+    plan = conn.execute("EXPLAIN QUERY PLAN " + storage.SELECT_TOP_N_SQL, (10,)).fetchall()
+    conn.close()
+    details = " ".join(row[-1] for row in plan)
+    assert "COVERING INDEX idx_scores_leaderboard" in details, details
+
+
+def test_get_top_n_np_matches_get_top_n(tmp_path):
+    """
+    get_top_n_np() should rank rows exactly like get_top_n(), including ties.
+    """
+    pytest.importorskip("numpy")
+    db_file = tmp_path / "leaderboard.db"
+    storage.init_db(db_path=str(db_file))
+
+    conn = sqlite3.connect(str(db_file))
+    conn.executemany(
+        "INSERT INTO scores(player_name, guesses, time_seconds, score, played_at)"
+        " VALUES (?, ?, ?, ?, ?)",
+        [
+            ('A', 3, 30.0, 18.0, '2025-01-01T00:00:00'),
+            ('B', 2, 40.0, 14.0, '2025-01-02T00:00:00'),
+            ('C', 2, 40.0, 14.0, '2025-01-03T00:00:00'),  # ties with B, newer
+            ('D', 4, 20.0, 22.0, '2025-01-04T00:00:00'),
+            ('E', 1, 90.0, 14.0, '2025-01-05T00:00:00'),  # ties with B and C, newest
+        ]
+    )
+    conn.commit()
+    conn.close()
+
+    for n in (0, 1, 2, 4, 10):
+        expected = [row[0] for row in storage.get_top_n(n=n, db_path=str(db_file))]
+        top = storage.get_top_n_np(n=n, db_path=str(db_file))
+        assert list(top['player_name']) == expected, f"Ranking mismatch for n={n}"